@@ -1,31 +1,263 @@
 import os
 import sys
+import errno
+import functools
+import queue
 import shutil
+import hashlib
+import itertools
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import tkinter.font as tkfont
 
 try:
-	from PIL import Image, ImageTk, ImageOps
+	import PIL
+	from PIL import Image, ImageTk, features
 except ImportError:
 	# Pillow not installed; provide a helpful message
 	raise SystemExit(
-		"Pillow is required. Install with: python -m pip install -r requirements.txt"
+		"Pillow is required. Install with: python -m pip install -r requirements.txt\n"
+		"Optional, x86 only: python -m pip install pillow-simd (faster resizing; replaces Pillow)"
 	)
 
+try:
+	# Optional: moves files to the OS recycle bin / trash (see PicCullApp use_system_trash)
+	from send2trash import send2trash  # type: ignore[import-untyped]
+except ImportError:
+	send2trash = None
+
+# Pillow-SIMD releases are versioned "X.Y.Z.postN"; stock Pillow never ships post releases.
+# With SIMD resampling LANCZOS is cheap enough to use directly at any scale.
+HAS_PILLOW_SIMD = ".post" in getattr(PIL, "__version__", "")
+
+
+IMG_EXTS = frozenset({".jpg", ".jpeg", ".png"})
+# Lower- and upper-case spellings for a C-level str.endswith check on raw names
+_IMG_SUFFIX_TUPLE = tuple(sorted(IMG_EXTS)) + tuple(sorted(e.upper() for e in IMG_EXTS))
+_IMG_SUFFIX_LOWER = tuple(sorted(IMG_EXTS))
+# Per-folder on-disk cache of downscaled JPEG previews, keyed by file name + size + mtime
+PREVIEW_CACHE_DIR = ".piccull-cache"
+PREVIEW_MAX = 2048
+# Each folder's preview cache is trimmed oldest-first to this size
+PREVIEW_CACHE_QUOTA = 128 * 1024 * 1024
+# Folder entries read on the Tk thread before the scan moves to a worker
+SCAN_SYNC_ENTRIES = 100
+# Per-user cache of gallery thumbnails shared by all folders, trimmed oldest-first to the quota
+THUMB_DISK_QUOTA = 256 * 1024 * 1024
+# Budget for gallery PhotoImages in memory; Tk keeps 4 bytes per pixel whatever the PIL mode
+THUMB_CACHE_BYTES = 128 * 1024 * 1024
+# Decoded viewer images kept normally: the current one, its neighbors and a few recent ones
+DECODED_CACHE_ENTRIES = 8
+# Budget (width * height * bands) instead of the entry bound while a small folder is preloaded
+DECODED_CACHE_BYTES = 768 * 1024 * 1024
+THUMB_DISK_FORMAT = "WEBP" if features.check("webp") else "PNG"
+# DecodeQueue priorities: lower runs first
+PRIO_VIEW = 0        # image the viewer is waiting on
+PRIO_PREFETCH = 5    # viewer neighbors
+PRIO_THUMB = 10      # gallery tiles on screen
+PRIO_THUMB_AHEAD = 15  # gallery tiles a screen away
+PRIO_BACKGROUND = 20  # folder preload, preview cache writes
+
+
+def is_image(name: str) -> bool:
+	# Common spellings match without allocating; mixed case (".Jpg") falls back to lower()
+	return name.endswith(_IMG_SUFFIX_TUPLE) or name.lower().endswith(_IMG_SUFFIX_LOWER)
+
+
+def iter_images(folder: Path) -> Iterator[Tuple[Path, int, int]]:
+	"""Yield (path, size, mtime_ns) for image files in directory order (unsorted)."""
+	# scandir exposes the file type from the directory read, avoiding a stat per entry;
+	# on Windows its stat comes from the same read too
+	with os.scandir(folder) as it:
+		for e in it:
+			if is_image(e.name) and e.is_file(follow_symlinks=False):
+				try:
+					st = e.stat(follow_symlinks=False)
+				except OSError:
+					# Deleted or renamed since the directory read (is_file used the cached type)
+					continue
+				yield Path(e.path), st.st_size, st.st_mtime_ns
+
+
+# EXIF orientation -> transpose that makes the image upright (mirrors ImageOps.exif_transpose)
+ORIENTATION_TRANSPOSE = {
+	2: Image.Transpose.FLIP_LEFT_RIGHT,
+	3: Image.Transpose.ROTATE_180,
+	4: Image.Transpose.FLIP_TOP_BOTTOM,
+	5: Image.Transpose.TRANSPOSE,
+	6: Image.Transpose.ROTATE_270,
+	7: Image.Transpose.TRANSVERSE,
+	8: Image.Transpose.ROTATE_90,
+}
+
+
+def user_cache_dir() -> Path:
+	"""Per-user cache root: %LOCALAPPDATA% on Windows, else $XDG_CACHE_HOME or ~/.cache."""
+	if sys.platform.startswith("win") and os.environ.get("LOCALAPPDATA"):
+		return Path(os.environ["LOCALAPPDATA"]) / "piccull" / "cache"
+	base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+	return Path(base) / "piccull"
+
+
+def trim_cache_dir(folder: Path, quota: int) -> None:
+	"""Delete least recently used files (by mtime) until folder holds at most quota bytes."""
+	try:
+		with os.scandir(folder) as it:
+			stats = [(e.stat(), e.path) for e in it if e.is_file()]
+	except OSError:
+		return
+	entries = [(st.st_mtime_ns, st.st_size, p) for st, p in stats]
+	total = sum(size for _, size, _ in entries)
+	entries.sort()
+	for _, size, p in entries:
+		if total <= quota:
+			break
+		try:
+			os.remove(p)
+			total -= size
+		except OSError:
+			pass
+
+
+def size_bucket(w: int, h: int) -> Tuple[int, int]:
+	"""Snap a canvas size down to a multiple of 32 (sizes under 32 are kept as is)."""
+	return (w - w % 32 or w, h - h % 32 or h)
+
 
-IMG_EXTS = {".jpg", ".jpeg", ".png"}
+def draft_bucket(w: int, h: int) -> Tuple[int, int]:
+	"""Round a decode target up to powers of two. Decoded images are cached per target, so
+	every window size up to the next doubling shares one decode (at most one extra DCT
+	scale step of pixels) and growing the window re-decodes only when it crosses one."""
+	return (1 << (max(1, w) - 1).bit_length(), 1 << (max(1, h) - 1).bit_length())
 
 
-def is_image(path: Path) -> bool:
-	return path.suffix.lower() in IMG_EXTS
+def stat_digest(path: Path, stat: Optional[Tuple[int, int]] = None) -> str:
+	"""Cache key from (size, mtime_ns), stat'ing path unless given; O(1) unlike hashing contents."""
+	if stat is None:
+		st = path.stat()
+		stat = (st.st_size, st.st_mtime_ns)
+	return hashlib.sha1(f"{path.name}|{stat[0]}|{stat[1]}".encode()).hexdigest()
 
 
-def list_images(folder: Path) -> List[Path]:
-	return sorted([p for p in folder.iterdir() if p.is_file() and is_image(p)], key=lambda p: p.name.lower())
+_TIFF_BYTE_ORDER: Dict[bytes, Literal["little", "big"]] = {b"II": "little", b"MM": "big"}
+
+
+def _tiff_orientation(tiff: bytes) -> Optional[int]:
+	# Look up tag 0x0112 in IFD0 of an EXIF TIFF block
+	if len(tiff) < 8:
+		return None
+	order = _TIFF_BYTE_ORDER.get(tiff[:2])
+	if order is None:
+		return None
+	ifd = int.from_bytes(tiff[4:8], order)
+	if ifd + 2 > len(tiff):
+		return None
+	count = int.from_bytes(tiff[ifd:ifd + 2], order)
+	for i in range(count):
+		entry = ifd + 2 + 12 * i
+		if entry + 12 > len(tiff):
+			return None
+		if int.from_bytes(tiff[entry:entry + 2], order) == 0x0112:
+			# SHORT value is left-justified in the 4-byte value field
+			value = int.from_bytes(tiff[entry + 8:entry + 10], order)
+			return value if 1 <= value <= 8 else 1
+	return 1
+
+
+def fast_orientation(path: Path) -> Optional[int]:
+	"""Read the EXIF orientation from a JPEG's APP1 segment only, without decoding.
+	Returns 1 when there is no orientation tag, or None for non-JPEG or malformed files.
+	"""
+	try:
+		with open(path, "rb") as f:
+			if f.read(2) != b"\xff\xd8":
+				return None
+			while True:
+				marker = f.read(2)
+				if len(marker) < 2 or marker[0] != 0xFF:
+					return None
+				if marker[1] in (0xD9, 0xDA):
+					# End of image / start of scan: no EXIF in the header
+					return 1
+				length = int.from_bytes(f.read(2), "big")
+				if length < 2:
+					return None
+				if marker[1] == 0xE1:
+					data = f.read(length - 2)
+					if data[:6] == b"Exif\x00\x00":
+						return _tiff_orientation(data[6:])
+					# Other APP1 payloads (e.g. XMP); keep scanning
+					continue
+				f.seek(length - 2, os.SEEK_CUR)
+	except OSError:
+		return None
+
+
+def fit_to_box(img: Image.Image, orientation: int, box: Tuple[int, int]) -> Tuple[int, int]:
+	"""Displayed size of img fitted into box, after its pending EXIF orientation is applied."""
+	w, h = img.size
+	if orientation in (5, 6, 7, 8):
+		w, h = h, w
+	scale = min(box[0] / w, box[1] / h)
+	return (max(1, int(w * scale)), max(1, int(h * scale)))
+
+
+def draft_to_fit(img: Image.Image, box: Tuple[int, int]) -> None:
+	"""Let a JPEG decode at the smallest DCT scale whose result still fits box at the image's
+	own aspect ratio; no-op for other formats. draft(box) alone wants both sides to cover box,
+	which over-decodes a portrait photo for a landscape window (and vice versa)."""
+	w, h = img.size
+	scale = min(1.0, box[0] / w, box[1] / h)
+	img.draft("RGB", (max(1, int(w * scale)), max(1, int(h * scale))))
+
+
+def exif_orientation(img: Image.Image) -> int:
+	"""EXIF orientation of an opened image (1 when absent or unreadable), without copying pixels."""
+	try:
+		orientation = img.getexif().get(0x0112, 1)
+	except Exception:
+		return 1
+	return orientation if orientation in ORIENTATION_TRANSPOSE else 1
+
+
+def decoded_nbytes(img: Image.Image) -> int:
+	"""Memory held by a loaded image's pixels, for cache budgets."""
+	return img.width * img.height * len(img.getbands())
+
+
+def drop_unused_alpha(img: Image.Image) -> Image.Image:
+	"""Return img as RGB when its alpha carries nothing, so resizes touch 3 bytes/pixel not 4.
+
+	Modes Tk cannot take directly (P, LA, CMYK, I;16, ...) are converted here once, so
+	ImageTk.PhotoImage never has to make its own converted copy on every render.
+	"""
+	if img.mode == "P":
+		# Tk would expand the palette anyway; keep alpha only if the palette is transparent
+		img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+	elif img.mode not in ("RGB", "RGBA", "L"):
+		img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+	if img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255):
+		img = img.convert("RGB")
+	return img
+
+
+def flatten_alpha(img: Image.Image, bg: str) -> Image.Image:
+	"""Return img as RGB, compositing any transparency onto bg instead of exposing hidden colors."""
+	if img.mode == "RGB":
+		return img
+	if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+		rgba = img.convert("RGBA")
+		flat = Image.new("RGB", rgba.size, bg)
+		flat.paste(rgba, mask=rgba.getchannel("A"))
+		return flat
+	return img.convert("RGB")
 
 
 def ensure_deleted_folder(base: Path) -> Path:
@@ -34,24 +266,102 @@ def ensure_deleted_folder(base: Path) -> Path:
 	return dest
 
 
-def safe_move_to_deleted(src: Path, deleted_dir: Path) -> Path:
-	"""Move src to deleted_dir, avoiding collisions by adding suffixes."""
+def _rename_or_move(src: Path, dest: Path) -> Path:
+	# A rename is atomic and O(1); only copy when dest is on another device
+	try:
+		os.rename(src, dest)
+	except OSError as e:
+		if e.errno != errno.EXDEV:
+			raise
+		shutil.move(str(src), str(dest))
+	return dest
+
+
+def _next_free_suffix(deleted_dir: Path, stem: str, ext: str) -> int:
+	# One directory listing instead of an exists() probe per taken suffix
+	prefix = f"{stem}-"
+	taken = 0
+	for name in os.listdir(deleted_dir):
+		if name.startswith(prefix) and name.endswith(ext):
+			n = name[len(prefix):len(name) - len(ext)]
+			if n.isdigit():
+				taken = max(taken, int(n))
+	return taken + 1
+
+
+def safe_move_to_deleted(
+	src: Path, deleted_dir: Path, counters: Optional[Dict[Tuple[Path, str, str], int]] = None
+) -> Path:
+	"""Move src to deleted_dir, avoiding collisions by adding -N suffixes.
+	counters remembers the next suffix per (deleted_dir, stem, ext); the first collision for a
+	name finds it with a single listing, later ones resolve in one probe.
+	"""
 	target = deleted_dir / src.name
 	if not target.exists():
-		shutil.move(str(src), str(target))
-		return target
+		return _rename_or_move(src, target)
 	stem, ext = src.stem, src.suffix
-	i = 1
+	if counters is None:
+		counters = {}
+	key = (deleted_dir, stem, ext)
+	i = counters.get(key)
+	if i is None:
+		i = _next_free_suffix(deleted_dir, stem, ext)
 	while True:
 		candidate = deleted_dir / f"{stem}-{i}{ext}"
-		if not candidate.exists():
-			shutil.move(str(src), str(candidate))
-			return candidate
 		i += 1
+		if not candidate.exists():
+			counters[key] = i
+			return _rename_or_move(src, candidate)
+
+
+class DecodeQueue:
+	"""Worker threads draining one shared priority queue (lower priority first).
+	submit() returns a Future, so callers poll and cancel it as with an executor;
+	a cancelled job is skipped when a worker reaches it.
+	"""
+
+	def __init__(self, workers: int) -> None:
+		self._q: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+		self._seq = itertools.count()  # FIFO within a priority; never compares Futures
+		self._threads = [
+			threading.Thread(target=self._work, name=f"piccull-decode-{n}", daemon=True)
+			for n in range(workers)
+		]
+		for t in self._threads:
+			t.start()
+
+	def submit(self, priority: int, fn: Callable, *args) -> Future:
+		fut: Future = Future()
+		self._q.put((priority, next(self._seq), fut, fn, args))
+		return fut
+
+	def _work(self) -> None:
+		while True:
+			_prio, _seq, fut, fn, args = self._q.get()
+			if fut is None:
+				return
+			if not fut.set_running_or_notify_cancel():
+				continue
+			try:
+				fut.set_result(fn(*args))
+			except BaseException as e:
+				fut.set_exception(e)
+
+	def shutdown(self) -> None:
+		# Cancel queued jobs, then stop each worker after its current job
+		while True:
+			try:
+				fut = self._q.get_nowait()[2]
+			except queue.Empty:
+				break
+			if fut is not None:
+				fut.cancel()
+		for _ in self._threads:
+			self._q.put((float("inf"), next(self._seq), None, None, ()))
 
 
 class PicCullApp(tk.Tk):
-	def __init__(self) -> None:
+	def __init__(self, use_system_trash: bool = False) -> None:
 		super().__init__()
 		self.title("PicCull")
 		self.geometry("1000x700")
@@ -79,13 +389,100 @@ class PicCullApp(tk.Tk):
 		self.images: List[Path] = []
 		self.index: int = -1
 		self.current_image_pil: Optional[Image.Image] = None
+		# EXIF orientation still to apply to current_image_pil; transposed after resizing
+		self.current_orientation: int = 1
 		self.current_photo: Optional[ImageTk.PhotoImage] = None
+		# Decoded (fully loaded) images with their pending EXIF orientation, keyed by
+		# (path, mtime_ns, draft target), with None as target when draft did not reduce the
+		# decode (PNGs, small JPEGs): full-size pixels serve every target; LRU order
+		self._decoded_cache: "OrderedDict[tuple[str, int, Optional[tuple[int, int]]], tuple[Image.Image, int]]" = (
+			OrderedDict()
+		)
+		self._decoded_cache_bytes: int = 0
+		# True while the current folder is preloaded: the byte budget replaces the entry bound
+		self._decoded_preloaded: bool = False
+		self._decoded_lock = threading.Lock()
+		# One pool decodes for the viewer, neighbor prefetch, gallery thumbnails and preload;
+		# PRIO_* orders the work so the image on screen never waits behind background jobs
+		self._decode_q = DecodeQueue(max(2, os.cpu_count() or 4))
+		# Pending decode of the image the viewer is waiting on
+		self._view_future: Optional[Future] = None
+		# Background decoding of neighbor images so Prev/Next hits the cache
+		self._prefetch_futures: list[Future] = []
+		# Neighbors also get fitted to the canvas in the background, keyed like _render_cache
+		# as (weak ref to source, resized); Prev/Next then only has to build the PhotoImage.
+		# Weak refs so an image evicted from _decoded_cache is not kept alive here
+		self._prerendered: "OrderedDict[Tuple[Path, int, int], Tuple[weakref.ref[Image.Image], Image.Image]]" = (
+			OrderedDict()
+		)
+		self._prerendered_lock = threading.Lock()
+		# File moves (delete) run here; at most one delete is in flight
+		self._io_exec = ThreadPoolExecutor(max_workers=2)
+		self._delete_future: Optional[Future] = None
+		# Delete sends files to the OS trash instead of .deleted (needs send2trash; no undo)
+		self.use_system_trash: bool = use_system_trash and send2trash is not None
+		# Next collision suffix per (.deleted folder, stem, ext) (see safe_move_to_deleted)
+		self._deleted_counters: Dict[Tuple[Path, str, str], int] = {}
+		# Streaming folder scan: the worker appends to _scan_buffer, the Tk thread drains it.
+		# Bumping _scan_gen (under _scan_lock) abandons an older scan.
+		self._scan_gen: int = 0
+		self._scan_buffer: List[Tuple[Path, int, int]] = []
+		# Image shown when the scan started (directory order); unless the user moves away
+		# from it, the finished scan selects the first image by name instead
+		self._scan_first: Optional[Path] = None
+		# (size, mtime_ns) per image as seen by the folder scan; cache keys use it instead of
+		# a stat per lookup (see _stat_of)
+		self._file_stats: Dict[Path, Tuple[int, int]] = {}
+		# EXIF orientation per (path, mtime_ns), once any decode has read it; re-decodes at
+		# other sizes and thumbnails then skip the header parse
+		self._orientations: Dict[Tuple[Path, int], int] = {}
+		self._scan_lock = threading.Lock()
+		# Small folders (total file size under budget) are decoded up front on all cores
+		self._preload_budget: int = 512 * 1024 * 1024
+		self._preload_futures: list[Future] = []
+		self.preload_var = tk.StringVar(value="")
+		# Canvas size the current image was decoded for (JPEG draft target)
+		self._current_target: Optional[Tuple[int, int]] = None
+		# Last reduce() result as (source, factor, reduced), reused across resize events
+		self._reduced: Optional[Tuple[Image.Image, int, Image.Image]] = None
+		# (id(source image), width, height) of current_photo, to skip no-op re-renders
+		self._last_rendered: Optional[Tuple[int, int, int]] = None
+		# True when current_photo is a fast interactive-resize preview awaiting the settle pass
+		self._last_rendered_fast: bool = False
+		# PhotoImage the canvas image item currently shows (None while hidden)
+		self._placed_photo: Optional[ImageTk.PhotoImage] = None
+		# (render cache key, _last_rendered key) of the quality render running on a worker;
+		# results for anything else are dropped
+		self._render_job: Optional[tuple] = None
+		# Its Future, cancelled whenever the job is dropped or replaced (see _drop_render_job)
+		self._render_future: Optional[Future] = None
+		# 32px-bucketed canvas size of the last render; resizes within it only re-center
+		self._last_bucket: Optional[Tuple[int, int]] = None
+		# Full-quality viewer photos keyed by (path, bucketed canvas size), as (source, photo).
+		# An entry only hits while its decoded source is still the current image, so a cached
+		# preview is never shown in place of the full decode. The source is held weakly, like
+		# in _prerendered, so only _decoded_cache decides which decodes stay in memory.
+		self._render_cache: "OrderedDict[Tuple[Path, int, int], Tuple[weakref.ref[Image.Image], ImageTk.PhotoImage]]" = (
+			OrderedDict()
+		)
 		self._resize_after_id: Optional[str] = None
+		self._settle_after_id: Optional[str] = None
+		# Reusable Tk photo (pasted into when size/mode match) and the canvas item showing it
+		self._tk_photo: Optional[ImageTk.PhotoImage] = None
+		self._tk_photo_key: Optional[Tuple[int, int, str]] = None
+		self._canvas_img_id: int      # initialized in _build_ui
+		self._canvas_msg_id: int      # initialized in _build_ui
 		# Undo: (original_parent, moved_to_path, original_index, original_name)
 		self._last_deleted: Optional[Tuple[Path, Path, int, str]] = None
+		# Last options applied per widget (see _configure_changed), to skip no-op configures
+		self._last_ui_state: Dict[str, Dict[str, object]] = {}
 		# Canvas arrow items
-		self._left_arrow_id: Optional[int] = None
-		self._right_arrow_id: Optional[int] = None
+		self._left_arrow_id: int      # initialized in _build_ui
+		self._right_arrow_id: int     # initialized in _build_ui
+		# (at_first, at_last, canvas w, canvas h) the arrows were last drawn for; None while hidden
+		self._arrow_state: Optional[Tuple[bool, bool, int, int]] = None
+		self._arrow_font: tkfont.Font  # initialized in _build_ui
+		self._arrow_font_size = 18
 
 		# Modes: 'viewer' or 'gallery'
 		self.mode: str = "viewer"
@@ -93,17 +490,49 @@ class PicCullApp(tk.Tk):
 		self.thumb_size: int = 200
 		self.thumb_size_var = tk.IntVar(value=self.thumb_size)
 		self.thumb_step: int = 48  # large increments to avoid frequent rebuilds
-		# Cache thumbnails for the session keyed by (path, size)
-		self.thumb_cache: dict[tuple[Path, int], ImageTk.PhotoImage] = {}
-		self._gallery_tiles: list[tk.Frame] = []
-		self._gallery_loaded_count: int = 0
-		self._gallery_loading: bool = False
-		self._gallery_load_after: Optional[str] = None
+		# Tile geometry: spacing between tiles, and tile width (thumbnail + border padding);
+		# _tile_w follows thumb_size (see _apply_thumb_size_from_scale)
+		self._gap: int = 16
+		self._tile_w: int = self.thumb_size + 4
+		# Thumbnails keyed by (path, size); LRU bounded by THUMB_CACHE_BYTES of Tk pixel data,
+		# so slider changes that leave other sizes behind cannot grow it without limit
+		self.thumb_cache: "OrderedDict[tuple[Path, int], ImageTk.PhotoImage]" = OrderedDict()
+		self._thumb_cache_bytes: int = 0
+		# path -> its thumb_cache keys (one per size), so purging a path skips the full scan
+		self._thumb_keys_by_path: "defaultdict[Path, set[tuple[Path, int]]]" = defaultdict(set)
+		# Entry bound for prefetched PIL thumbnails; a few screens, set in _reconcile_viewport
+		self._thumb_cache_max: int = 256
+		# Virtual gallery: live tiles (and their canvas window items) exist only near the viewport
+		self._gallery_tiles: dict[int, tk.Frame] = {}
+		self._gallery_tile_items: dict[int, int] = {}
+		self._gallery_tile_futures: dict[int, Future] = {}
+		# Index whose tile border is drawn highlighted; new tiles pick their border at creation
+		self._highlighted: Optional[int] = None
+		self._gallery_region: Optional[Tuple[int, int, int, int]] = None
+		self._gallery_layout: Optional[Tuple[int, int, int]] = None  # (width, cols, thumb size)
+		self._gallery_view: Optional[Tuple[float, int]] = None  # (top y, image count) last reconciled
+		self._reconcile_after: Optional[str] = None
 		self._gallery_container: ttk.Frame  # initialized in _build_gallery_ui
 		self.gallery_canvas: tk.Canvas     # initialized in _build_gallery_ui
 		self.gallery_vscroll: ttk.Scrollbar
-		self.gallery_frame: ttk.Frame
-		self._gallery_window_id: Optional[int] = None
+		# Thumbnails decode on _decode_q; finished jobs land in _thumb_results (thread-safe, no Tk)
+		# and the Tk thread drains it in _pump_thumbs while any are pending
+		self._thumb_results: "queue.SimpleQueue[tuple[Future, tk.Label, tuple[Path, int]]]" = queue.SimpleQueue()
+		self._thumb_futures: list[Future] = []
+		self._thumb_pending: int = 0
+		self._thumb_pump_after: Optional[str] = None
+		self._thumb_placeholders: dict[int, ImageTk.PhotoImage] = {}
+		# One screen ahead/behind the gallery view is decoded into PIL thumbnails in advance;
+		# tiles scrolled into view turn them into PhotoImages without waiting on the pool
+		self._thumb_pil_cache: "OrderedDict[tuple[Path, int], Image.Image]" = OrderedDict()
+		self._thumb_pil_lock = threading.Lock()
+		self._thumb_prefetching: set[tuple[Path, int]] = set()
+		self._thumb_prefetch_futures: list[Future] = []
+		# Thumbnails persist across sessions here; hits are touched so trimming drops the oldest
+		self._thumb_disk_dir = user_cache_dir() / "thumbs"
+		self._thumb_disk_stores: int = 0
+		# Preview cache writes, to trim the folder's .piccull-cache now and then
+		self._preview_stores: int = 0
 
 		# UI
 		self._build_ui()
@@ -200,6 +629,23 @@ class PicCullApp(tk.Tk):
 		)
 		self.canvas.pack(fill=tk.BOTH, expand=True)
 		self.canvas.bind("<Configure>", self._on_canvas_resize)
+		# Persistent items, reconfigured rather than deleted: the image and a hint/error text
+		self._canvas_img_id = self.canvas.create_image(0, 0, anchor="center", state="hidden")
+		self._canvas_msg_id = self.canvas.create_text(0, 0, text="", state="hidden")
+		# Prev/next arrows, also persistent: _draw_arrows positions them and toggles state.
+		# Both share one named font, so a resize only changes its size, never re-parses a font spec
+		self._arrow_font = tkfont.Font(self, family=self.font_family, size=18)
+		self._left_arrow_id = self.canvas.create_text(
+			0, 0, text="‹", fill=self.colors["fg"], font=self._arrow_font, anchor="w", state="hidden"
+		)
+		self._right_arrow_id = self.canvas.create_text(
+			0, 0, text="›", fill=self.colors["fg"], font=self._arrow_font, anchor="e", state="hidden"
+		)
+		self.canvas.tag_bind(self._left_arrow_id, "<Button-1>", lambda e: self.prev_image())
+		self.canvas.tag_bind(self._right_arrow_id, "<Button-1>", lambda e: self.next_image())
+		for item in (self._left_arrow_id, self._right_arrow_id):
+			self.canvas.tag_bind(item, "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
+			self.canvas.tag_bind(item, "<Leave>", lambda e: self.canvas.config(cursor=""))
 
 		# Gallery container (canvas + scrollbar), initially hidden
 		self._build_gallery_ui()
@@ -209,8 +655,16 @@ class PicCullApp(tk.Tk):
 		bottom.pack(side=tk.BOTTOM, fill=tk.X)
 		self.counter_label = ttk.Label(bottom, text="", style="Muted.TLabel")
 		self.counter_label.pack(side=tk.LEFT, padx=(8, 0), pady=6)
+		self.counter_label.bind("<Button-1>", lambda e: self._on_counter_click())
 		self.status_label = ttk.Label(bottom, text="Pick a folder to begin", style="Muted.TLabel")
 		self.status_label.pack(side=tk.LEFT, padx=8, pady=6)
+		self.preload_label = ttk.Label(bottom, textvariable=self.preload_var, style="Muted.TLabel")
+		self.preload_label.pack(side=tk.RIGHT, padx=8, pady=6)
+		if HAS_PILLOW_SIMD:
+			# Let users confirm the faster build is the one actually imported
+			ttk.Label(bottom, text=f"Pillow-SIMD {PIL.__version__}", style="Muted.TLabel").pack(
+				side=tk.RIGHT, padx=8, pady=6
+			)
 
 		self._update_controls()
 
@@ -272,7 +726,8 @@ class PicCullApp(tk.Tk):
 		return "TkFixedFont"
 
 	def _bind_keys(self) -> None:
-		self.bind("<Escape>", lambda e: self.destroy())
+		# Same cleanup as the window's close button
+		self.bind("<Escape>", lambda e: self._on_close())
 		self.bind("<Left>", lambda e: self.prev_image())
 		self.bind("<Right>", lambda e: self.next_image())
 		self.bind("<Delete>", lambda e: self.delete_current())
@@ -291,37 +746,170 @@ class PicCullApp(tk.Tk):
 		if not path:
 			return
 		folder = Path(path)
-		imgs = list_images(folder)
 		self.folder = folder
-		self.images = imgs
-		self.index = 0 if imgs else -1
+		self.images = []
+		self.index = -1
 		self._last_deleted = None
-		self._set_status()
+		self._cancel_prefetch()
+		self._cancel_preload()
+		with self._decoded_lock:
+			self._decoded_cache.clear()
+			self._decoded_cache_bytes = 0
+		with self._scan_lock:
+			self._scan_gen += 1
+			self._scan_buffer = []
+			gen = self._scan_gen
+		self._file_stats.clear()
+		self._orientations.clear()
+		# The first entries are read right here so an image shows without waiting on a poll;
+		# the same scandir generator then continues on the I/O worker
+		entries = iter_images(folder)
+		try:
+			first = list(itertools.islice(entries, SCAN_SYNC_ENTRIES))
+		except OSError:
+			# Fails again on the worker, where _poll_scan reports it
+			first, entries = [], iter_images(folder)
+		self.images = [p for p, _, _ in first]
+		if len(first) < SCAN_SYNC_ENTRIES:
+			# The whole folder was read here: start on the first image by name, like the final sort
+			self.images.sort(key=lambda p: p.name.lower())
+		self._file_stats.update((p, (size, mtime)) for p, size, mtime in first)
+		self.index = 0 if self.images else -1
+		self._scan_first = self.images[0] if self.images else None
+		fut = self._io_exec.submit(self._scan_folder, entries, gen)
+		self._set_status(extra="Scanning...")
 		self._show_current()
 		self._update_controls()
 		# Rebuild gallery content if needed
 		self._rebuild_gallery()
+		self.after(30, self._poll_scan, fut, gen)
+
+	def _scan_folder(self, entries: Iterator[Tuple[Path, int, int]], gen: int) -> None:
+		# Runs on the I/O worker; must not touch Tk
+		for entry in entries:
+			with self._scan_lock:
+				if gen != self._scan_gen:
+					return
+				self._scan_buffer.append(entry)
+
+	def _poll_scan(self, fut: Future, gen: int) -> None:
+		if gen != self._scan_gen:
+			return
+		# Check completion before draining so nothing appended in between is missed
+		done = fut.done()
+		with self._scan_lock:
+			batch, self._scan_buffer = self._scan_buffer, []
+		if batch:
+			self.images.extend(p for p, _, _ in batch)
+			self._file_stats.update((p, (size, mtime)) for p, size, mtime in batch)
+			if self.index == -1:
+				self.index = 0
+				self._scan_first = self.images[0]
+				self._show_current()
+		if not done:
+			self._set_status(extra=f"{len(self.images)} images found (scanning...)")
+			self._update_controls()
+			self.after(30, self._poll_scan, fut, gen)
+			return
+		# Final sort by name. Keep the image selected if the user moved to it during the scan;
+		# otherwise they are still on whatever scandir returned first, so go to the first by name
+		current = self.images[self.index] if self.index >= 0 else None
+		self.images.sort(key=lambda p: p.name.lower())
+		if current is not None and current != self._scan_first:
+			self.index = self.images.index(current)
+		elif self.images:
+			self.index = 0
+			if current != self.images[0]:
+				self._show_current()
+		self._set_status()
+		self._update_controls()
+		self._rebuild_gallery()
+		err = fut.exception()
+		if err is not None:
+			messagebox.showerror("Error", f"Failed to read folder:\n{err}")
+			return
+		paths = list(self.images)
+		size_fut = self._io_exec.submit(lambda: sum(self._stat_of(p)[0] for p in paths))
+		self.after(50, self._maybe_preload, size_fut, paths, gen)
 
-	def _set_status(self, extra: str = "") -> None:
-		if self.index == -1 or not self.images:
-			text = "No images found" if self.folder else "Pick a folder to begin"
+	def _maybe_preload(self, size_fut: Future, paths: List[Path], gen: int) -> None:
+		if gen != self._scan_gen:
+			return
+		if not size_fut.done():
+			self.after(50, self._maybe_preload, size_fut, paths, gen)
+			return
+		if size_fut.exception() is not None or size_fut.result() >= self._preload_budget:
+			return
+		# Folder is small on disk: decode it in parallel until the decoded-bytes budget fills
+		with self._decoded_lock:
+			self._decoded_preloaded = True
+		target = self._draft_target()
+		self._preload_futures = [
+			self._decode_q.submit(PRIO_BACKGROUND, self._preload_one, p, target, gen) for p in paths
+		]
+		self._poll_preload(gen)
+
+	def _preload_one(self, path: Path, target: Tuple[int, int], gen: int) -> None:
+		# Runs on a decode worker; must not touch Tk
+		if gen != self._scan_gen or self._decoded_cache_bytes >= DECODED_CACHE_BYTES:
+			# Past the budget every preload would only evict another image
+			return
+		try:
+			# Not a preview per file: only images actually viewed earn a spot in the folder cache
+			self._get_decoded(path, target, store_preview=False)
+		except Exception:
+			pass
+
+	def _poll_preload(self, gen: int) -> None:
+		if gen != self._scan_gen or not self._preload_futures:
+			self.preload_var.set("")
+			return
+		done = sum(1 for f in self._preload_futures if f.done())
+		total = len(self._preload_futures)
+		if done < total:
+			self.preload_var.set(f"Preloading {done}/{total}")
+			self.after(100, self._poll_preload, gen)
 		else:
-			im_path = self.images[self.index]
-			text = f"{self.index + 1}/{len(self.images)} — {im_path.name}"
-		if extra:
-			text = f"{text}  |  {extra}"
-		# Update counter and status parts
+			self.preload_var.set("")
+			self._preload_futures = []
+
+	def _cancel_preload(self) -> None:
+		for fut in self._preload_futures:
+			fut.cancel()
+		self._preload_futures = []
+		self.preload_var.set("")
+		# Back to the small entry bound for whatever folder comes next
+		with self._decoded_lock:
+			self._decoded_preloaded = False
+			self._trim_decoded_locked()
+
+	def _refresh(self) -> None:
+		# After the index moved: status, the current view, then controls
+		self._set_status()
+		if self.mode == "viewer":
+			self._show_current()
+		else:
+			self._update_selection_highlight()
+			self._ensure_selected_visible()
+		self._update_controls()
+
+	def _configure_changed(self, name: str, widget: tk.Misc, **options) -> None:
+		# Skip configure calls (and Tk option parsing) when the widget already has these values
+		if self._last_ui_state.get(name) != options:
+			widget.configure(**options)
+			self._last_ui_state[name] = options
+
+	def _set_status(self, extra: str = "") -> None:
 		if self.index == -1 or not self.images:
-			self.counter_label.configure(text="")
-			self.status_label.configure(text=text)
+			counter = ""
+			info = "No images found" if self.folder else "Pick a folder to begin"
 		else:
-			im_path = self.images[self.index]
 			counter = f"{self.index + 1}/{len(self.images)}"
-			info = f" — {im_path.name}"
-			if extra:
-				info = f"{info}  |  {extra}"
-			self.counter_label.configure(text=counter)
-			self.status_label.configure(text=info)
+			info = f" — {self.images[self.index].name}"
+		if extra:
+			info = f"{info}  |  {extra}"
+		self._configure_changed("counter", self.counter_label, text=counter)
+		self._configure_changed("status", self.status_label, text=info)
 
 	def _update_controls(self) -> None:
 		has_images = bool(self.images)
@@ -329,30 +917,21 @@ class PicCullApp(tk.Tk):
 		at_last = has_images and self.index >= (len(self.images) - 1)
 
 		# Prev/Next enabled based on edges (no wrap)
-		self.btn_prev.configure(state=(tk.NORMAL if (has_images and not at_first) else tk.DISABLED))
-		self.btn_next.configure(state=(tk.NORMAL if (has_images and not at_last) else tk.DISABLED))
-		self.btn_delete.configure(state=(tk.NORMAL if has_images else tk.DISABLED))
-		self.btn_undo.configure(state=(tk.NORMAL if self._last_deleted else tk.DISABLED))
+		self._configure_changed("prev", self.btn_prev, state=(tk.NORMAL if (has_images and not at_first) else tk.DISABLED))
+		self._configure_changed("next", self.btn_next, state=(tk.NORMAL if (has_images and not at_last) else tk.DISABLED))
+		self._configure_changed(
+			"delete", self.btn_delete, state=(tk.NORMAL if (has_images and self._delete_future is None) else tk.DISABLED)
+		)
+		self._configure_changed("undo", self.btn_undo, state=(tk.NORMAL if self._last_deleted else tk.DISABLED))
 
-		# Bind/unbind counter click for jump
-		try:
-			self.counter_label.unbind("<Button-1>")
-			self.counter_label.unbind("<Enter>")
-			self.counter_label.unbind("<Leave>")
-		except Exception:
-			pass
-		if has_images:
-			self.counter_label.configure(cursor="hand2")
-			self.counter_label.bind("<Button-1>", lambda e: self._on_counter_click())
-			self.counter_label.bind("<Enter>", lambda e: self.counter_label.configure(cursor="hand2"))
-			self.counter_label.bind("<Leave>", lambda e: self.counter_label.configure(cursor=""))
-		else:
-			self.counter_label.configure(cursor="")
+		# The counter is clickable (jump to image) whenever there are images; the click
+		# binding is permanent and _on_counter_click ignores an empty list
+		self._configure_changed("counter_cursor", self.counter_label, cursor=("hand2" if has_images else ""))
 
-		# Update canvas arrows
+		# Update canvas arrows (a no-op unless edges or canvas size changed)
 		self._draw_arrows()
 		# Update mode button label
-		self.btn_mode.configure(text=("Viewer" if self.mode == "gallery" else "Gallery"))
+		self._configure_changed("mode", self.btn_mode, text=("Viewer" if self.mode == "gallery" else "Gallery"))
 
 	def _on_enter_key(self) -> None:
 		if self.mode == "gallery":
@@ -375,114 +954,93 @@ class PicCullApp(tk.Tk):
 		target = int(val) - 1
 		if 0 <= target < n and target != self.index:
 			self.index = target
-			self._set_status()
-			self._show_current()
-			self._update_controls()
-			if self.mode == "gallery":
-				self._update_selection_highlight()
-				self._ensure_selected_visible()
+			self._refresh()
 
 	def _ask_image_number(self, total: int, current: int) -> Optional[int]:
-		"""Open a minimalist modal to ask for an image number (1..total)."""
-		top = tk.Toplevel(self)
-		top.title("Go to image")
-		top.configure(bg=self.colors["panel"])  # background to match app
-		top.transient(self)
-		top.resizable(False, False)
-		top.grab_set()
-
-		frm = ttk.Frame(top, style="Panel.TFrame", padding=12)
-		frm.pack(fill=tk.BOTH, expand=True)
-
-		lbl = ttk.Label(frm, text=f"Enter image number (1-{total}):", style="TLabel")
-		lbl.pack(anchor="w", pady=(0, 6))
-
-		var = tk.StringVar(value=str(current))
-		entry = ttk.Entry(frm, font=self.base_font, textvariable=var)
-		entry.pack(fill=tk.X)
-		entry.select_range(0, tk.END)
-		entry.focus_set()
-
-		btns = ttk.Frame(frm, style="Panel.TFrame")
-		btns.pack(fill=tk.X, pady=(10, 0))
-		cancel_btn = ttk.Button(btns, text="Cancel", command=top.destroy)
-		ok_btn = ttk.Button(btns, text="OK")
-		cancel_btn.pack(side=tk.RIGHT)
-		ok_btn.pack(side=tk.RIGHT, padx=(0, 8))
-
-		result: dict[str, Optional[int]] = {"value": None}
-
-		def on_ok(_e=None) -> None:
-			s = var.get().strip()
-			if not s.isdigit():
-				entry.bell()
-				return
-			v = int(s)
-			if v < 1 or v > total:
-				entry.bell()
-				return
-			result["value"] = v
-			top.destroy()
-
-		ok_btn.configure(command=on_ok)
-		top.bind("<Return>", on_ok)
-		top.bind("<Escape>", lambda e: top.destroy())
-
-		# Center the dialog over the app window
-		top.update_idletasks()
-		x = self.winfo_rootx() + (self.winfo_width() // 2 - top.winfo_width() // 2)
-		y = self.winfo_rooty() + (self.winfo_height() // 2 - top.winfo_height() // 2)
-		top.geometry(f"+{max(0, x)}+{max(0, y)}")
-
-		top.wait_window()
-		return result["value"]
+		"""Ask for an image number (1..total); None if cancelled."""
+		# askinteger validates the range itself and re-prompts on bad input
+		return simpledialog.askinteger(
+			"Go to image",
+			f"Enter image number (1-{total}):",
+			parent=self,
+			minvalue=1,
+			maxvalue=total,
+			initialvalue=current,
+		)
 
 	def prev_image(self) -> None:
 		if not self.images or self.index <= 0:
 			return
 		self.index -= 1
-		self._set_status()
-		if self.mode == "viewer":
-			self._show_current()
-		else:
-			self._update_selection_highlight()
-			self._ensure_selected_visible()
-		self._update_controls()
+		self._refresh()
 
 	def next_image(self) -> None:
 		if not self.images or self.index >= (len(self.images) - 1):
 			return
 		self.index += 1
-		self._set_status()
-		if self.mode == "viewer":
-			self._show_current()
-		else:
-			self._update_selection_highlight()
-			self._ensure_selected_visible()
-		self._update_controls()
+		self._refresh()
 
 	def delete_current(self) -> None:
-		if not self.images:
+		if not self.images or self._delete_future is not None:
 			return
 		cur = self.images[self.index]
+		# Move on a worker so slow filesystems don't freeze the UI; Delete stays disabled meanwhile
+		if self.use_system_trash:
+			self._delete_future = self._io_exec.submit(send2trash, str(cur))
+		else:
+			self._delete_future = self._io_exec.submit(
+				lambda: safe_move_to_deleted(cur, ensure_deleted_folder(cur.parent), self._deleted_counters)
+			)
+		self._update_controls()
+		self.after(50, self._poll_delete, self._delete_future, cur)
+
+	def _poll_delete(self, fut: Future, cur: Path) -> None:
+		if not fut.done():
+			self.after(50, self._poll_delete, fut, cur)
+			return
+		self._delete_future = None
 		try:
-			target_dir = ensure_deleted_folder(cur.parent)
-			moved_to = safe_move_to_deleted(cur, target_dir)
-			# Remove from list and adjust index
-			original_index = self.index
-			original_parent = cur.parent
-			original_name = cur.name
-			del self.images[self.index]
-			# Purge any thumbnails for this path from cache (all sizes)
-			self._purge_thumb_cache_for_path(cur)
-			# Prepare undo info
+			moved_to = fut.result()
+		except Exception as e:
+			self._update_controls()
+			messagebox.showerror("Error", f"Failed to move file:\n{e}")
+			return
+		if cur not in self.images:
+			# Folder changed while the move was in flight
+			self._update_controls()
+			return
+		# Remove from list and adjust index
+		original_index = self.images.index(cur)
+		original_parent = cur.parent
+		original_name = cur.name
+		del self.images[original_index]
+		st = self._file_stats.pop(cur, None)
+		if st is not None:
+			# The file is gone from the folder; its cached preview should not linger
+			self._io_exec.submit(self._remove_preview, cur, st)
+		if original_index < self.index:
+			self.index -= 1
+		self._cancel_prefetch()
+		# Drop only this file's decodes so a preloaded folder stays in memory
+		with self._decoded_lock:
+			for key in [k for k in self._decoded_cache if k[0] == str(cur)]:
+				self._decoded_cache_bytes -= decoded_nbytes(self._decoded_cache.pop(key)[0])
+		# Purge any thumbnails and viewer renders for this path (all sizes)
+		self._purge_caches_for_path(cur)
+		# Prepare undo info; the OS trash has no portable restore, so trashing clears it
+		if moved_to is None:
+			self._last_deleted = None
+		else:
 			self._last_deleted = (original_parent, Path(moved_to), original_index, original_name)
 
-			if self.images:
-				# Clamp to last element if we deleted last
-				self.index = min(self.index, len(self.images) - 1)
-			else:
-				self.index = -1
+		if self.images:
+			# Clamp to last element if we deleted last
+			self.index = min(self.index, len(self.images) - 1)
+		else:
+			self.index = -1
+		if moved_to is None:
+			self._set_status(extra=f"Moved {original_name} to the trash")
+		else:
 			# Build a friendly path string; prefer relative to chosen folder if available
 			rel_display = moved_to.name
 			if self.folder is not None:
@@ -491,14 +1049,12 @@ class PicCullApp(tk.Tk):
 				except Exception:
 					rel_display = moved_to.name
 			self._set_status(extra=f"Moved to {rel_display}")
-			if self.mode == "viewer":
-				self._show_current()
-			else:
-				# Rebuild gallery grid after delete
-				self._rebuild_gallery()
-			self._update_controls()
-		except Exception as e:
-			messagebox.showerror("Error", f"Failed to move file:\n{e}")
+		if self.mode == "viewer":
+			self._show_current()
+		else:
+			# Rebuild gallery grid after delete
+			self._rebuild_gallery()
+		self._update_controls()
 
 	def undo_last_delete(self) -> None:
 		if not self._last_deleted:
@@ -537,20 +1093,30 @@ class PicCullApp(tk.Tk):
 
 	# ----- Rendering -----
 	def _show_current(self) -> None:
-		self.canvas.delete("all")
+		self.canvas.itemconfigure(self._canvas_msg_id, state="hidden")
 		self.current_image_pil = None
-		self.current_photo = None
+		# current_photo stays on screen until the new image is ready
+		self._last_rendered = None
+		self._drop_render_job()
+		if self._view_future is not None:
+			self._view_future.cancel()
+			self._view_future = None
 
 		if self.index == -1 or not self.images:
+			self.canvas.itemconfigure(self._canvas_img_id, state="hidden")
+			self.current_photo = None
+			self._placed_photo = None
 			# Draw a soft hint text
 			w = self.canvas.winfo_width() or 800
 			h = self.canvas.winfo_height() or 600
-			self.canvas.create_text(
-				w // 2,
-				h // 2,
+			self.canvas.coords(self._canvas_msg_id, w // 2, h // 2)
+			self.canvas.itemconfigure(
+				self._canvas_msg_id,
 				text="No image",
 				fill=self.colors["muted"],
 				font=self.base_font,
+				anchor="center",
+				state="normal",
 			)
 			# No image; also clear arrows
 			self._draw_arrows()
@@ -558,102 +1124,481 @@ class PicCullApp(tk.Tk):
 
 		path = self.images[self.index]
 		try:
-			img = Image.open(path)
-			# Correct orientation from EXIF if present
-			img = ImageOps.exif_transpose(img)
-			self.current_image_pil = img
-			self._render_to_canvas()
+			target = self._draft_target()
+			decoded = self._peek_decoded(path, target)
+			if decoded is None:
+				# Decode off the Tk thread ahead of any background work; a cached preview,
+				# if there is one, is shown meanwhile and swapped out in _poll_full_decode
+				self._view_future = self._decode_q.submit(PRIO_VIEW, self._get_decoded, path, target)
+				self.after(10, self._poll_full_decode, self._view_future, path, target)
+				preview = self._load_preview(path, target)
+				if preview is not None:
+					# Stand-in only: a quick BILINEAR fit, so no LANCZOS job competes with the decode
+					self.current_image_pil, self.current_orientation = preview, 1
+					self._current_target = target
+					self._render_to_canvas(Image.Resampling.BILINEAR)
+			if decoded is not None:
+				self.current_image_pil, self.current_orientation = decoded
+				self._current_target = target
+				self._render_to_canvas()
+			elif self.current_image_pil is None:
+				self._draw_arrows()
+			self._schedule_prefetch()
 		except Exception as e:
-			self.canvas.create_text(
-				20,
-				20,
-				text=f"Error loading {path.name}: {e}",
-				fill="#FF5555",
-				anchor="nw",
-				font=self.small_font,
-			)
-			self._draw_arrows()
+			self._show_load_error(path, e)
 
-	def _on_canvas_resize(self, _event) -> None:
-		if self.mode != "viewer" or not self.current_image_pil:
+	def _show_load_error(self, path: Path, e: BaseException) -> None:
+		self.canvas.itemconfigure(self._canvas_img_id, state="hidden")
+		self.current_photo = None
+		self._placed_photo = None
+		self.canvas.coords(self._canvas_msg_id, 20, 20)
+		self.canvas.itemconfigure(
+			self._canvas_msg_id,
+			text=f"Error loading {path.name}: {e}",
+			fill="#FF5555",
+			anchor="nw",
+			font=self.small_font,
+			state="normal",
+		)
+		self._draw_arrows()
+
+	def _draft_target(self) -> Tuple[int, int]:
+		# Decode size hint for JPEGs: the canvas, or a sensible default before it is mapped
+		w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+		return draft_bucket(w if w > 1 else 1600, h if h > 1 else 1200)
+
+	def _get_decoded(
+		self, path: Path, target: Tuple[int, int], store_preview: bool = True
+	) -> Tuple[Image.Image, int]:
+		"""Return (image, orientation) for path, decoding only on cache miss.
+		JPEGs are decoded via libjpeg's DCT scaling to the smallest size that still
+		covers target, which skips most of the IDCT work for large photos. The EXIF
+		orientation is returned rather than applied so the caller can transpose the
+		small resized image instead; PNGs are taken as upright (orientation 1).
+		store_preview=False skips writing the on-disk preview (folder preload).
+		"""
+		decoded = self._peek_decoded(path, target)
+		if decoded is None:
+			# Known from an earlier decode of this file (any size, viewer or thumbnail)?
+			okey = (path, self._stat_of(path)[1])
+			orientation = self._orientations.get(okey)
+			if orientation is None:
+				orientation = fast_orientation(path)
+			with Image.open(path) as src:
+				full_size = src.size
+				if src.format == "JPEG":
+					tw, th = target
+					# Draft applies to the stored orientation; swap for 90-degree rotations
+					if orientation in (5, 6, 7, 8):
+						tw, th = th, tw
+					draft_to_fit(src, (tw, th))
+				# Only a decode that draft actually scaled down is specific to this target
+				key = self._decoded_key(path, target if src.size != full_size else None)
+				# Load now so resizes never touch the file
+				if src.format == "PNG":
+					# PNGs practically never carry EXIF; skip the metadata walk and copy
+					src.load()
+					decoded = (drop_unused_alpha(src), 1)
+				elif orientation is not None:
+					# Known orientation: skip Pillow's EXIF parse and the transpose copy
+					src.load()
+					decoded = (drop_unused_alpha(src), orientation)
+				else:
+					# Read the tag only; the transpose happens after resizing, like for JPEGs
+					orientation = exif_orientation(src)
+					src.load()
+					decoded = (drop_unused_alpha(src), orientation)
+			self._orientations[okey] = decoded[1]
+			if store_preview:
+				# Persist a preview for future sessions without holding up this decode
+				self._decode_q.submit(PRIO_BACKGROUND, self._store_preview, path, *decoded)
+			with self._decoded_lock:
+				# Another worker may have decoded the same key meanwhile; replace, don't double count
+				old = self._decoded_cache.pop(key, None)
+				if old is not None:
+					self._decoded_cache_bytes -= decoded_nbytes(old[0])
+				self._decoded_cache[key] = decoded
+				self._decoded_cache_bytes += decoded_nbytes(decoded[0])
+				self._trim_decoded_locked()
+		return decoded
+
+	def _trim_decoded_locked(self) -> None:
+		# Caller holds _decoded_lock. Evict LRU decodes past the entry bound (byte budget while
+		# preloaded), always keeping the newest
+		while len(self._decoded_cache) > 1 and (
+			self._decoded_cache_bytes > DECODED_CACHE_BYTES
+			or (not self._decoded_preloaded and len(self._decoded_cache) > DECODED_CACHE_ENTRIES)
+		):
+			_, (evicted, _) = self._decoded_cache.popitem(last=False)
+			self._decoded_cache_bytes -= decoded_nbytes(evicted)
+
+	def _stat_of(self, path: Path) -> Tuple[int, int]:
+		# (size, mtime_ns) from the folder scan; stat only files the scan did not see
+		st = self._file_stats.get(path)
+		if st is None:
+			res = path.stat()
+			st = (res.st_size, res.st_mtime_ns)
+		return st
+
+	def _decoded_key(
+		self, path: Path, target: Optional[Tuple[int, int]]
+	) -> tuple[str, int, Optional[Tuple[int, int]]]:
+		return (str(path), self._stat_of(path)[1], target)
+
+	def _peek_decoded(self, path: Path, target: Tuple[int, int]) -> Optional[Tuple[Image.Image, int]]:
+		# Cache lookup only; never decodes. A full-size decode satisfies any target.
+		drafted = self._decoded_key(path, target)
+		with self._decoded_lock:
+			for key in (drafted, drafted[:2] + (None,)):
+				decoded = self._decoded_cache.get(key)
+				if decoded is not None:
+					self._decoded_cache.move_to_end(key)
+					return decoded
+		return None
+
+	def _preview_cache_path(self, src: Path) -> Path:
+		return src.parent / PREVIEW_CACHE_DIR / f"{stat_digest(src, self._stat_of(src))}.jpg"
+
+	def _load_preview(self, path: Path, target: Tuple[int, int]) -> Optional[Image.Image]:
+		"""Return the cached on-disk preview for path (already upright), if any.
+		Runs on the Tk thread, so the JPEG is drafted down to target before decoding.
+		"""
+		try:
+			cached = self._preview_cache_path(path)
+			if not cached.exists():
+				return None
+			img = Image.open(cached)
+			draft_to_fit(img, target)
+			img.load()
+			return img
+		except Exception:
+			return None
+
+	def _store_preview(self, path: Path, img: Image.Image, orientation: int) -> None:
+		# Runs on a decode worker; write atomically so readers never see partial files
+		try:
+			dest = self._preview_cache_path(path)
+			if dest.exists():
+				return
+			dest.parent.mkdir(exist_ok=True)
+			# JPEG has no alpha: show transparent areas as the viewer background, as the full image will
+			preview = img.copy() if img.mode in ("RGB", "L") else flatten_alpha(img, self.colors["bg"])
+			preview.thumbnail((PREVIEW_MAX, PREVIEW_MAX), Image.Resampling.BILINEAR)
+			if orientation in ORIENTATION_TRANSPOSE:
+				preview = preview.transpose(ORIENTATION_TRANSPOSE[orientation])
+			# Several workers can decode one file at once (view, prefetch, re-decode at a new size)
+			tmp = dest.with_suffix(f".{threading.get_ident()}.tmp")
+			preview.save(tmp, "JPEG", quality=85)
+			os.replace(tmp, dest)
+		except Exception:
 			return
-		# Debounce rapid resize events
-		if self._resize_after_id:
+		# The cache lives in the user's photo folder; keep it bounded
+		self._preview_stores += 1
+		if self._preview_stores % 64 == 1:
+			trim_cache_dir(dest.parent, PREVIEW_CACHE_QUOTA)
+
+	def _remove_preview(self, path: Path, stat: Tuple[int, int]) -> None:
+		# Runs on the I/O worker after path was deleted; stat is the one the preview was keyed by
+		try:
+			os.remove(path.parent / PREVIEW_CACHE_DIR / f"{stat_digest(path, stat)}.jpg")
+		except OSError:
+			pass
+
+	def _poll_full_decode(self, fut: Future, path: Path, target: Tuple[int, int]) -> None:
+		if not fut.done():
+			self.after(10, self._poll_full_decode, fut, path, target)
+			return
+		if fut is self._view_future:
+			self._view_future = None
+		if fut.cancelled():
+			return
+		# Only swap in if the user is still looking at the same image
+		if self.mode == "viewer" and 0 <= self.index < len(self.images) and self.images[self.index] == path:
+			err = fut.exception()
+			if err is not None:
+				# A preview already on screen is good enough; otherwise report the failure
+				if self.current_image_pil is None:
+					self._show_load_error(path, err)
+				return
+			self.current_image_pil, self.current_orientation = fut.result()
+			self._current_target = target
+			self._render_to_canvas()
+
+	def _schedule_prefetch(self) -> None:
+		# Decode the next and previous images off the Tk thread
+		self._cancel_prefetch()
+		neighbors = [i for i in (self.index + 1, self.index - 1) if 0 <= i < len(self.images)]
+		if neighbors:
+			paths = [self.images[i] for i in neighbors]
+			target = self._draft_target()
+			self._prefetch_futures.append(
+				self._decode_q.submit(PRIO_PREFETCH, self._prefetch, paths, target, self._last_bucket)
+			)
+
+	def _prefetch(self, paths: List[Path], target: Tuple[int, int], bucket: Optional[Tuple[int, int]]) -> None:
+		# Runs on a decode worker; must not touch Tk
+		for path in paths:
 			try:
-				self.after_cancel(self._resize_after_id)
+				img, orientation = self._get_decoded(path, target)
+				if bucket is None:
+					continue
+				key = (path, *bucket)
+				with self._prerendered_lock:
+					entry = self._prerendered.get(key)
+				if entry is not None and entry[0]() is img:
+					continue
+				resized = self._render_fit(img, orientation, fit_to_box(img, orientation, bucket), None)
+				with self._prerendered_lock:
+					self._prerendered[key] = (weakref.ref(img), resized)
+					while len(self._prerendered) > 4:
+						self._prerendered.popitem(last=False)
 			except Exception:
 				pass
-		self._resize_after_id = self.after(80, self._render_to_canvas)
 
-	def _render_to_canvas(self) -> None:
+	def _take_prerendered(self, key: Tuple[Path, int, int], src: Image.Image) -> Optional[Image.Image]:
+		# Claim a background fit of src for this canvas bucket, if the prefetch made one
+		with self._prerendered_lock:
+			entry = self._prerendered.pop(key, None)
+		return entry[1] if entry is not None and entry[0]() is src else None
+
+	def _cancel_prefetch(self) -> None:
+		for fut in self._prefetch_futures:
+			fut.cancel()
+		self._prefetch_futures.clear()
+
+	def _on_canvas_resize(self, event) -> None:
+		if self.mode != "viewer" or not self.current_image_pil:
+			return
+		if size_bucket(event.width, event.height) == self._last_bucket:
+			# Same fit as on screen: just keep the image and arrows centered
+			self.canvas.coords(self._canvas_img_id, event.width // 2, event.height // 2)
+			self._draw_arrows()
+			return
+		# Debounce rapid resize events: cheap BILINEAR preview while dragging, full quality once quiet
+		# Cancelling an id that already fired is a no-op in Tk
+		for after_id in (self._resize_after_id, self._settle_after_id):
+			if after_id:
+				self.after_cancel(after_id)
+		self._resize_after_id = self.after(30, lambda: self._render_to_canvas(Image.Resampling.BILINEAR))
+		self._settle_after_id = self.after(250, self._render_to_canvas)
+
+	def _render_to_canvas(self, resample: Optional[Image.Resampling] = None) -> None:
+		"""Fit the current image to the canvas.
+		resample forces a single fast filter (interactive resize); None picks the quality path.
+		"""
 		if self.mode != "viewer" or not self.current_image_pil:
 			return
 		canvas_w = max(1, self.canvas.winfo_width())
 		canvas_h = max(1, self.canvas.winfo_height())
-		img_w, img_h = self.current_image_pil.size
-
-		scale = min(canvas_w / img_w, canvas_h / img_h)
-		new_w = max(1, int(img_w * scale))
-		new_h = max(1, int(img_h * scale))
-		resized = self.current_image_pil.resize((new_w, new_h), Image.Resampling.LANCZOS)
+		target = self._current_target
+		if (
+			resample is None
+			and target is not None
+			and (canvas_w > target[0] or canvas_h > target[1])
+			and 0 <= self.index < len(self.images)
+		):
+			# Canvas grew past the draft size: decode again at the new size off the Tk thread;
+			# this render uses what we have and _poll_full_decode swaps the sharper one in
+			view_path = self.images[self.index]
+			self._current_target = draft_bucket(canvas_w, canvas_h)
+			decoded = self._peek_decoded(view_path, self._current_target)
+			if decoded is not None:
+				# Already decoded at this size, or at full size (then it is what is shown)
+				self.current_image_pil, self.current_orientation = decoded
+			else:
+				if self._view_future is not None:
+					self._view_future.cancel()
+				self._view_future = self._decode_q.submit(
+					PRIO_VIEW, self._get_decoded, view_path, self._current_target
+				)
+				self.after(10, self._poll_full_decode, self._view_future, view_path, self._current_target)
+		# Fit to the canvas snapped down to 32px buckets so nearby sizes share cached renders
+		self._last_bucket = size_bucket(canvas_w, canvas_h)
+		bucket_w, bucket_h = self._last_bucket
+		src = self.current_image_pil
+		new_w, new_h = fit_to_box(src, self.current_orientation, self._last_bucket)
+		key = (id(src), new_w, new_h)
+		if (
+			key != self._last_rendered
+			or self.current_photo is None
+			or (resample is None and self._last_rendered_fast)
+		):
+			# No cache key without a path (nothing to purge it by on delete)
+			render_key: Optional[Tuple[Path, int, int]] = (
+				(self.images[self.index], bucket_w, bucket_h) if 0 <= self.index < len(self.images) else None
+			)
+			cached = self._render_cache.get(render_key) if render_key is not None else None
+			if render_key is not None and cached is not None and cached[0]() is src:
+				# Same image at a canvas size we already rendered at full quality
+				self._drop_render_job()
+				self._render_cache.move_to_end(render_key)
+				self.current_photo = cached[1]
+				fast = False
+			elif resample is not None:
+				# Interactive preview: paste into the reusable photo
+				self._drop_render_job()
+				preview = self._render_fit(src, self.current_orientation, (new_w, new_h), resample)
+				self.current_photo = self._photo_for(preview)
+				# Tk holds its own copy of the pixels now
+				preview.close()
+				fast = True
+			else:
+				resized = self._take_prerendered(render_key, src) if render_key is not None else None
+				if resized is None:
+					# LANCZOS runs on a decode worker (Pillow drops the GIL while resampling);
+					# whatever is on screen stays up until _poll_render shows the result
+					job = (render_key, key)
+					if job != self._render_job:
+						self._drop_render_job()
+						self._render_job = job
+						fut = self._decode_q.submit(
+							PRIO_VIEW, self._render_fit, src, self.current_orientation, (new_w, new_h), None
+						)
+						self._render_future = fut
+						self.after(10, self._poll_render, fut, job, src)
+					self._place_photo()
+					return
+				self._drop_render_job()
+				self._finish_render(resized, src, render_key)
+				fast = False
+			self._last_rendered = key
+			self._last_rendered_fast = fast
+		self._place_photo()
+
+	def _finish_render(
+		self, resized: Image.Image, src: Image.Image, render_key: Optional[Tuple[Path, int, int]]
+	) -> None:
+		# Cached photos must never be pasted into, so full-quality renders get their own
 		self.current_photo = ImageTk.PhotoImage(resized)
-
-		self.canvas.delete("all")
-		self.canvas.create_image(canvas_w // 2, canvas_h // 2, image=self.current_photo, anchor="center")
+		resized.close()
+		if render_key is not None:
+			self._render_cache[render_key] = (weakref.ref(src), self.current_photo)
+			while len(self._render_cache) > 8:
+				self._render_cache.popitem(last=False)
+
+	def _drop_render_job(self) -> None:
+		# The pending quality render is no longer wanted: cancel it so it does not hold a
+		# PRIO_VIEW slot ahead of the next image's decode
+		if self._render_future is not None:
+			self._render_future.cancel()
+			self._render_future = None
+		self._render_job = None
+
+	def _poll_render(self, fut: Future, job: tuple, src: Image.Image) -> None:
+		if not fut.done():
+			self.after(10, self._poll_render, fut, job, src)
+			return
+		if job != self._render_job:
+			# Superseded by navigation, a drag preview or another size
+			if not fut.cancelled() and fut.exception() is None:
+				fut.result().close()
+			return
+		self._render_job = None
+		self._render_future = None
+		if fut.cancelled() or fut.exception() is not None or src is not self.current_image_pil:
+			return
+		render_key, key = job
+		self._finish_render(fut.result(), src, render_key)
+		self._last_rendered = key
+		self._last_rendered_fast = False
+		self._place_photo()
+
+	def _place_photo(self) -> None:
+		# Center current_photo on the canvas (if there is one) and update the arrows
+		if self.current_photo is not None:
+			canvas_w = max(1, self.canvas.winfo_width())
+			canvas_h = max(1, self.canvas.winfo_height())
+			self.canvas.coords(self._canvas_img_id, canvas_w // 2, canvas_h // 2)
+			if self.current_photo is not self._placed_photo:
+				# A photo repainted in place (_photo_for) or a no-op re-render needs only the coords
+				self.canvas.itemconfigure(self._canvas_img_id, image=self.current_photo, state="normal")
+				self._placed_photo = self.current_photo
 		self._draw_arrows()
 
-	def _clear_arrow_items(self) -> None:
-		if self._left_arrow_id is not None:
-			try:
-				self.canvas.delete(self._left_arrow_id)
-			except Exception:
-				pass
-			self._left_arrow_id = None
-		if self._right_arrow_id is not None:
-			try:
-				self.canvas.delete(self._right_arrow_id)
-			except Exception:
-				pass
-			self._right_arrow_id = None
+	def _render_fit(
+		self, src: Image.Image, orientation: int, size: Tuple[int, int], resample: Optional[Image.Resampling]
+	) -> Image.Image:
+		"""Resize a decoded image to size (from fit_to_box) and make it upright.
+		resample None means LANCZOS; the resize runs in stored orientation and the small result
+		is transposed afterwards.
+		"""
+		if orientation in (5, 6, 7, 8):
+			size = (size[1], size[0])
+		inv = max(src.width / size[0], src.height / size[1])
+		if not HAS_PILLOW_SIMD and inv >= 4:
+			# Large downscale: box-reduce by a power of two while keeping at least 2x for
+			# the final filter, so it sees 4x+ fewer pixels at the same quality. Powers
+			# of two also let nearby canvas sizes (and drag previews) share the reduction.
+			factor = 1 << (int(inv / 2).bit_length() - 1)
+			src = self._reduce_cached(src, factor)
+		resized = src.resize(size, resample if resample is not None else Image.Resampling.LANCZOS)
+		if orientation in ORIENTATION_TRANSPOSE:
+			resized = resized.transpose(ORIENTATION_TRANSPOSE[orientation])
+		return resized
+
+	def _photo_for(self, img: Image.Image) -> ImageTk.PhotoImage:
+		# Paste into the existing Tk photo when possible instead of allocating a new one
+		key = (img.width, img.height, img.mode)
+		if self._tk_photo is not None and self._tk_photo_key == key:
+			self._tk_photo.paste(img)
+		else:
+			self._tk_photo = ImageTk.PhotoImage(img)
+			self._tk_photo_key = key
+		return self._tk_photo
+
+	def _reduce_cached(self, src: Image.Image, factor: int) -> Image.Image:
+		if factor <= 1:
+			return src
+		if src is not self.current_image_pil:
+			# Background pre-renders of neighbors must not evict the current image's reduction
+			return src.reduce(factor)
+		if self._reduced is not None and self._reduced[0] is src and self._reduced[1] == factor:
+			return self._reduced[2]
+		reduced = src.reduce(factor)
+		self._reduced = (src, factor, reduced)
+		return reduced
+
+	def _hide_arrows(self) -> None:
+		if self._arrow_state is not None:
+			for item in (self._left_arrow_id, self._right_arrow_id):
+				self.canvas.itemconfigure(item, state="hidden")
+			self.canvas.config(cursor="")
+			self._arrow_state = None
 
 	def _draw_arrows(self) -> None:
-		# Remove existing arrows
-		self._clear_arrow_items()
-		if self.mode != "viewer":
-			return
-		has_images = bool(self.images)
-		if not has_images or self.index < 0:
+		if self.mode != "viewer" or not self.images or self.index < 0:
+			self._hide_arrows()
 			return
 		at_first = self.index <= 0
 		at_last = self.index >= (len(self.images) - 1)
 
 		cw = self.canvas.winfo_width() or 800
 		ch = self.canvas.winfo_height() or 600
-		y = ch // 2
-		# Responsive arrow size
-		size = max(18, min(72, int(ch * 0.08)))
-		arrow_font = (self.font_family, size)
-		padding = max(16, int(cw * 0.02))
-		x_left = padding
-		x_right = cw - padding
-
-		# Left arrow (hidden on first)
-		if not at_first:
-			self._left_arrow_id = self.canvas.create_text(
-				x_left, y, text="‹", fill=self.colors["fg"], font=arrow_font, anchor="w"
-			)
-			self.canvas.tag_bind(self._left_arrow_id, "<Button-1>", lambda e: self.prev_image())
-			self.canvas.tag_bind(self._left_arrow_id, "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
-			self.canvas.tag_bind(self._left_arrow_id, "<Leave>", lambda e: self.canvas.config(cursor=""))
-
-		# Right arrow (hidden on last)
-		if not at_last:
-			self._right_arrow_id = self.canvas.create_text(
-				x_right, y, text="›", fill=self.colors["fg"], font=arrow_font, anchor="e"
-			)
-			self.canvas.tag_bind(self._right_arrow_id, "<Button-1>", lambda e: self.next_image())
-			self.canvas.tag_bind(self._right_arrow_id, "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
-			self.canvas.tag_bind(self._right_arrow_id, "<Leave>", lambda e: self.canvas.config(cursor=""))
+		state = (at_first, at_last, cw, ch)
+		if state == self._arrow_state:
+			# Called for every render; nothing to redraw unless edges or canvas changed
+			return
+		prev = self._arrow_state
+		self._arrow_state = state
+		if prev is None or prev[2:] != state[2:]:
+			# Canvas size changed: move and rescale both items
+			y = ch // 2
+			# Responsive arrow size; the items follow the named font, width-only changes skip it
+			size = max(18, min(72, int(ch * 0.08)))
+			if size != self._arrow_font_size:
+				self._arrow_font.configure(size=size)
+				self._arrow_font_size = size
+			padding = max(16, int(cw * 0.02))
+			self.canvas.coords(self._left_arrow_id, padding, y)
+			self.canvas.coords(self._right_arrow_id, cw - padding, y)
+		# Left arrow hidden on the first image, right arrow on the last
+		if prev is None or prev[0] != at_first:
+			self.canvas.itemconfigure(self._left_arrow_id, state=("hidden" if at_first else "normal"))
+		if prev is None or prev[1] != at_last:
+			self.canvas.itemconfigure(self._right_arrow_id, state=("hidden" if at_last else "normal"))
+		if at_first or at_last:
+			# A hidden item gets no <Leave>; drop the hand cursor it may have set
+			self.canvas.config(cursor="")
 
 	# ---------- Gallery UI ----------
 	def _build_gallery_ui(self) -> None:
@@ -667,15 +1612,12 @@ class PicCullApp(tk.Tk):
 		self.gallery_vscroll = ttk.Scrollbar(
 			self._gallery_container, orient="vertical", command=self.gallery_canvas.yview
 		)
-		self.gallery_canvas.configure(yscrollcommand=self.gallery_vscroll.set)
+		# Any view change (wheel, scrollbar, yview_moveto) reconciles the live tiles
+		self.gallery_canvas.configure(yscrollcommand=self._on_gallery_yscroll)
 		self.gallery_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 		self.gallery_vscroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-		self.gallery_frame = ttk.Frame(self.gallery_canvas, style="TFrame")
-		self._gallery_window_id = self.gallery_canvas.create_window(
-			(0, 0), window=self.gallery_frame, anchor="nw"
-		)
-		self.gallery_frame.bind("<Configure>", self._on_gallery_frame_configure)
+		# Tiles are embedded directly as canvas window items at computed positions
 		self.gallery_canvas.bind("<Configure>", self._on_gallery_canvas_configure)
 		# Note: mouse wheel is handled globally in _on_global_mouse_wheel
 
@@ -708,34 +1650,58 @@ class PicCullApp(tk.Tk):
 		self.thumb_panel.pack_forget()
 		# Show viewer canvas
 		self.canvas.pack(fill=tk.BOTH, expand=True)
-		self._show_current()
-		self._set_status()
-		self._update_controls()
+		self._refresh()
 
 	def _rebuild_gallery(self) -> None:
-		if not self.gallery_frame:
-			return
-		# Clear existing tiles
-		for child in list(self.gallery_frame.winfo_children()):
-			child.destroy()
-		self._gallery_tiles.clear()
-		# Build tiles
-		# Create placeholders list matching images; actual tiles will be created lazily
-		self._gallery_tiles = [None] * len(self.images)  # type: ignore[list-item]
-		self._gallery_loaded_count = 0
-		self._layout_gallery()
-		self._load_next_batch()
-		self._update_selection_highlight()
+		# Drop queued decodes and all live tiles; the viewport is rebuilt from scratch
+		for fut in self._thumb_futures:
+			fut.cancel()
+		self._cancel_thumb_prefetch()
+		self._clear_gallery_tiles()
+		self._gallery_layout = None
+		self._reconcile_viewport()
 		self._ensure_selected_visible()
 
-	def _create_tile(self, parent: tk.Misc, index: int, path: Path) -> tk.Frame:
+	def _clear_gallery_tiles(self) -> None:
+		# One canvas call removes every window item; then only the frames remain to destroy
+		self.gallery_canvas.delete("tile")
+		self._gallery_tile_items.clear()
+		for fut in self._gallery_tile_futures.values():
+			fut.cancel()
+		self._gallery_tile_futures.clear()
+		for tile in self._gallery_tiles.values():
+			tile.destroy()
+		self._gallery_tiles.clear()
+
+	def _drop_tile(self, i: int) -> None:
+		tile = self._gallery_tiles.pop(i)
+		self.gallery_canvas.delete(self._gallery_tile_items.pop(i))
+		fut = self._gallery_tile_futures.pop(i, None)
+		if fut is not None:
+			fut.cancel()
+		tile.destroy()
+
+	def _create_tile(self, parent: tk.Misc, index: int, path: Path, prio: int = PRIO_THUMB) -> tk.Frame:
 		# Outer frame as border
-		outer = tk.Frame(parent, bg=self.colors["border"])
+		outer = tk.Frame(parent, bg=(self.colors["fg"] if index == self.index else self.colors["border"]))
 		inner = tk.Frame(outer, bg=self.colors["panel"])  # image background
 		inner.pack(padx=1, pady=1)
-		thumb = self._get_thumbnail(path)
-		lbl = tk.Label(inner, image=thumb, bg=self.colors["panel"]) 
+		key = (path, self.thumb_size)
+		thumb = self.thumb_cache.get(key)
+		if thumb is not None:
+			self.thumb_cache.move_to_end(key)
+		else:
+			with self._thumb_pil_lock:
+				pil = self._thumb_pil_cache.pop(key, None)
+			if pil is not None:
+				thumb = self._finalize_thumb(pil, key)
+		shown = thumb if thumb is not None else self._placeholder_thumb(self.thumb_size)
+		lbl = tk.Label(inner, image=shown, bg=self.colors["panel"])
+		# Keep a reference so LRU eviction can't free an image that is still displayed
+		lbl.image = shown  # type: ignore[attr-defined]
 		lbl.pack()
+		if thumb is None:
+			self._gallery_tile_futures[index] = self._queue_thumb(path, self.thumb_size, lbl, prio)
 		# Mouse bindings
 		def on_click(_e=None, i=index):
 			self.index = i
@@ -753,46 +1719,185 @@ class PicCullApp(tk.Tk):
 		lbl.bind("<Double-Button-1>", on_double)
 		return outer
 
-	def _get_thumbnail(self, path: Path, size: Optional[int] = None) -> ImageTk.PhotoImage:
-		s = int(size or self.thumb_size)
+	def _placeholder_thumb(self, s: int) -> ImageTk.PhotoImage:
+		# One shared grey square per size, shown until the real thumbnail arrives
+		photo = self._thumb_placeholders.get(s)
+		if photo is None:
+			photo = ImageTk.PhotoImage(Image.new("RGB", (s, s), color=(34, 34, 34)))
+			self._thumb_placeholders[s] = photo
+		return photo
+
+	def _queue_thumb(self, path: Path, s: int, lbl: tk.Label, prio: int = PRIO_THUMB) -> Future:
 		key = (path, s)
-		cached = self.thumb_cache.get(key)
-		if cached is not None:
-			return cached
+		fut = self._decode_q.submit(prio, self._decode_thumb, path, s)
+		self._thumb_futures.append(fut)
+		self._thumb_pending += 1
+		fut.add_done_callback(lambda f: self._thumb_results.put((f, lbl, key)))
+		if self._thumb_pump_after is None:
+			self._thumb_pump_after = self.after(15, self._pump_thumbs)
+		return fut
+
+	def _prefetch_thumbs(self, lo: int, hi: int) -> None:
+		# Queue PIL decodes for images[lo:hi] that are not cached or already in flight
+		s = self.thumb_size
+		for i in range(max(0, lo), min(len(self.images), hi)):
+			key = (self.images[i], s)
+			if key in self.thumb_cache:
+				continue
+			with self._thumb_pil_lock:
+				if key in self._thumb_pil_cache or key in self._thumb_prefetching:
+					continue
+				self._thumb_prefetching.add(key)
+			fut = self._decode_q.submit(PRIO_THUMB_AHEAD, self._prefetch_thumb, key)
+			fut.add_done_callback(functools.partial(self._thumb_prefetch_done, key))
+			self._thumb_prefetch_futures.append(fut)
+
+	def _thumb_prefetch_done(self, key: tuple[Path, int], _fut: Future) -> None:
+		# Any thread (done callback): the key may be queued again
+		self._thumb_prefetching.discard(key)
+
+	def _cancel_thumb_prefetch(self) -> None:
+		for fut in self._thumb_prefetch_futures:
+			fut.cancel()
+		self._thumb_prefetch_futures = []
+
+	def _prefetch_thumb(self, key: tuple[Path, int]) -> None:
+		# Runs on a decode worker; must not touch Tk
+		img = self._decode_thumb(*key)
+		with self._thumb_pil_lock:
+			self._thumb_pil_cache[key] = img
+			while len(self._thumb_pil_cache) > self._thumb_cache_max:
+				self._thumb_pil_cache.popitem(last=False)
+
+	def _decode_thumb(self, path: Path, s: int) -> Image.Image:
+		"""Decode and shrink one thumbnail; runs on a decode worker, so no Tk calls."""
 		try:
-			img = Image.open(path)
-			img = ImageOps.exif_transpose(img)
-			img.thumbnail((s, s), Image.Resampling.LANCZOS)
-			photo = ImageTk.PhotoImage(img)
-			self.thumb_cache[key] = photo
-			return photo
+			cached = self._thumb_disk_path(path, s)
+			try:
+				# Already upright and sized: no EXIF pass, no resampling
+				img: Image.Image = Image.open(cached)
+				img.load()
+				os.utime(cached)
+				return self._opaque_thumb(img)
+			except OSError:
+				pass
+			with Image.open(path) as src:
+				# JPEG: let libjpeg scale down in the DCT while decoding; no-op for other formats
+				draft_to_fit(src, (s * 2, s * 2))
+				okey = (path, self._stat_of(path)[1])
+				orientation = self._orientations.get(okey)
+				if orientation is None:
+					# Same rule as _get_decoded: PNGs are taken as upright, whatever EXIF they carry
+					orientation = 1 if src.format == "PNG" else exif_orientation(src)
+					self._orientations[okey] = orientation
+				src.load()
+				img = src
+			# Draft already brought JPEGs near 2x; a box average is plenty at tile size
+			img.thumbnail((s, s), Image.Resampling.BOX)
+			# Rotate the small result rather than a full-size copy (the box is square)
+			if orientation in ORIENTATION_TRANSPOSE:
+				img = img.transpose(ORIENTATION_TRANSPOSE[orientation])
+			img = self._opaque_thumb(img)
+			# The store gets its own copy since the Tk thread closes img once it is shown
+			self._decode_q.submit(PRIO_BACKGROUND, self._store_thumb, cached, img.copy())
+			return img
 		except Exception:
 			# Fallback: empty placeholder
-			ph = Image.new("RGB", (s, s), color=(34, 34, 34))
-			photo = ImageTk.PhotoImage(ph)
-			self.thumb_cache[key] = photo
-			return photo
-
-	def _purge_thumb_cache_for_path(self, path: Path) -> None:
-		# Remove all sizes for a given path from cache
-		to_delete = [k for k in self.thumb_cache.keys() if k[0] == path]
-		for k in to_delete:
-			self.thumb_cache.pop(k, None)
-
-	def _on_gallery_frame_configure(self, _event=None) -> None:
-		if not self.gallery_canvas or not self.gallery_frame:
+			return Image.new("RGB", (s, s), color=(34, 34, 34))
+
+	def _opaque_thumb(self, img: Image.Image) -> Image.Image:
+		# Tiles sit on an opaque panel: flatten to 3-byte RGB so Tk blits without alpha
+		return flatten_alpha(img, self.colors["panel"])
+
+	def _thumb_disk_path(self, path: Path, s: int) -> Path:
+		# Keyed by absolute path, file size and mtime, so edited files simply miss
+		size, mtime = self._stat_of(path)
+		# absolute() is pure string work; resolve() would cost a stat per path component
+		key = f"{path.absolute()}|{size}|{mtime}|{s}"
+		return self._thumb_disk_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.{THUMB_DISK_FORMAT.lower()}"
+
+	def _store_thumb(self, dest: Path, img: Image.Image) -> None:
+		# Runs on a decode worker; write atomically so readers never see partial files
+		try:
+			dest.parent.mkdir(parents=True, exist_ok=True)
+			if img.mode not in ("RGB", "RGBA"):
+				img = img.convert("RGBA" if "A" in img.mode or "transparency" in img.info else "RGB")
+			tmp = dest.with_suffix(f".{threading.get_ident()}.tmp")
+			if THUMB_DISK_FORMAT == "WEBP":
+				img.save(tmp, "WEBP", quality=80, method=0)
+			else:
+				img.save(tmp, "PNG", compress_level=1)
+			os.replace(tmp, dest)
+		except Exception:
 			return
-		self.gallery_canvas.configure(scrollregion=self.gallery_canvas.bbox("all"))
-		self._maybe_trigger_load_more()
+		# Check the quota now and then rather than on every write
+		self._thumb_disk_stores += 1
+		if self._thumb_disk_stores % 256 == 1:
+			trim_cache_dir(self._thumb_disk_dir, THUMB_DISK_QUOTA)
+
+	def _finalize_thumb(self, img: Image.Image, key: tuple[Path, int]) -> ImageTk.PhotoImage:
+		# Tk thread only: PhotoImage creation is not thread-safe
+		photo = ImageTk.PhotoImage(img)
+		# Tk copied the pixels; free the PIL buffer now rather than at collection
+		img.close()
+		self.thumb_cache[key] = photo
+		self._thumb_cache_bytes += 4 * photo.width() * photo.height()
+		self._thumb_keys_by_path[key[0]].add(key)
+		while self._thumb_cache_bytes > THUMB_CACHE_BYTES and len(self.thumb_cache) > 1:
+			old, old_photo = self.thumb_cache.popitem(last=False)
+			self._thumb_cache_bytes -= 4 * old_photo.width() * old_photo.height()
+			keys = self._thumb_keys_by_path[old[0]]
+			keys.discard(old)
+			if not keys:
+				del self._thumb_keys_by_path[old[0]]
+		return photo
+
+	def _pump_thumbs(self) -> None:
+		self._thumb_pump_after = None
+		while True:
+			try:
+				fut, lbl, key = self._thumb_results.get_nowait()
+			except queue.Empty:
+				break
+			self._thumb_pending -= 1
+			if fut.cancelled():
+				continue
+			photo = self.thumb_cache.get(key)
+			if photo is None:
+				photo = self._finalize_thumb(fut.result(), key)
+			if lbl.winfo_exists():
+				lbl.configure(image=photo)
+				lbl.image = photo  # type: ignore[attr-defined]
+		self._thumb_futures = [f for f in self._thumb_futures if not f.done()]
+		if self._thumb_pending > 0:
+			self._thumb_pump_after = self.after(15, self._pump_thumbs)
+
+	def _purge_caches_for_path(self, path: Path) -> None:
+		# Remove all thumbnail sizes and viewer renders for a given path
+		for k in self._thumb_keys_by_path.pop(path, ()):
+			photo = self.thumb_cache.pop(k, None)
+			if photo is not None:
+				self._thumb_cache_bytes -= 4 * photo.width() * photo.height()
+		for rk in [rk for rk in self._render_cache if rk[0] == path]:
+			del self._render_cache[rk]
+		with self._prerendered_lock:
+			for rk in [rk for rk in self._prerendered if rk[0] == path]:
+				del self._prerendered[rk]
 
 	def _on_gallery_canvas_configure(self, _event=None) -> None:
-		# Ensure the inner frame matches canvas width and reflow layout
-		if not self.gallery_canvas or self._gallery_window_id is None:
+		# Width or height changed: reflow columns and materialize newly visible rows.
+		# A window drag sends a burst of these; reconcile once when Tk goes idle.
+		if self._reconcile_after is None:
+			self._reconcile_after = self.after_idle(self._reconcile_viewport)
+
+	def _on_gallery_yscroll(self, first: "str | float", last: "str | float") -> None:
+		self.gallery_vscroll.set(first, last)
+		# Scrollregion updates from a reconcile echo back here; only a moved view exposes new rows
+		if self._gallery_view == (self.gallery_canvas.canvasy(0), len(self.images)):
 			return
-		cw = self.gallery_canvas.winfo_width()
-		self.gallery_canvas.itemconfigure(self._gallery_window_id, width=cw)
-		self._layout_gallery()
-		self._maybe_trigger_load_more()
+		# Coalesce bursts of scroll updates into one reconcile
+		if self._reconcile_after is None:
+			self._reconcile_after = self.after_idle(self._reconcile_viewport)
 
 	def _on_global_mouse_wheel(self, event) -> str | None:
 		"""Global wheel handler.
@@ -817,12 +1922,11 @@ class PicCullApp(tk.Tk):
 		if wclass in ("TScrollbar", "Scrollbar", "TScale"):
 			return None
 
-		# Gallery scroll when pointer is over gallery canvas or its inner frame/children
+		# Gallery scroll when pointer is over gallery canvas or its tiles
 		if self.mode == "gallery" and self.gallery_canvas:
-			if within(w, self.gallery_canvas) or within(w, self.gallery_frame):
+			if within(w, self.gallery_canvas):
 				units = int(-event.delta / 120) or (1 if event.delta < 0 else -1)
 				self.gallery_canvas.yview_scroll(units, "units")
-				self._maybe_trigger_load_more()
 				return "break"
 
 		# Viewer: navigate prev/next when pointer is over viewer canvas
@@ -836,108 +1940,90 @@ class PicCullApp(tk.Tk):
 
 		return None
 
-	def _ensure_loaded_upto(self, idx: int) -> None:
-		# Load more thumbnails up to include the index.
-		while idx >= self._gallery_loaded_count and self._gallery_loaded_count < len(self._gallery_tiles):
-			self._load_next_batch()
-
-	def _layout_gallery(self) -> None:
-		if not self.gallery_canvas or not self.gallery_frame:
+	def _reconcile_viewport(self) -> None:
+		"""Keep live tiles only for rows intersecting the viewport (plus one row of margin).
+		The scrollregion is sized for every image, so no widgets exist for hidden rows.
+		"""
+		if self._reconcile_after is not None:
+			self.after_cancel(self._reconcile_after)
+			self._reconcile_after = None
+		n = len(self.images)
+		if self.mode != "gallery" or n == 0:
+			self._clear_gallery_tiles()
+			self._gallery_region = None
+			self._gallery_view = None
+			self.gallery_canvas.configure(scrollregion=(0, 0, 0, 0))
 			return
 		cw = max(1, self.gallery_canvas.winfo_width())
-		gap = 16
-		tile_w = self.thumb_size + 2 + 2  # inner + border padding
-		cols = max(1, (cw - gap) // (tile_w + gap))
-		# Place any already-created tiles; placeholders will be skipped
-		for i, tile in enumerate(self._gallery_tiles):
-			if tile is None:
-				continue
-			row = i // cols
-			col = i % cols
-			tile.grid(row=row, column=col, padx=gap, pady=gap, sticky="n")
-		# Make columns expand equally
-		for c in range(cols):
-			self.gallery_frame.grid_columnconfigure(c, weight=1)
+		ch = max(1, self.gallery_canvas.winfo_height())
+		gap = self._gap
+		cols = self._cols()
+		row_height = self._tile_w + gap
+		rows = (n + cols - 1) // cols
+		region = (0, 0, cw, rows * row_height + gap)
+		if region != self._gallery_region:
+			self._gallery_region = region
+			self.gallery_canvas.configure(scrollregion=region)
+		view_y0 = self.gallery_canvas.canvasy(0)
+		first_row = max(0, int(view_y0 // row_height) - 1)
+		last_row = int((view_y0 + ch) // row_height) + 1
+		lo, hi = first_row * cols, min(n, (last_row + 1) * cols)
+		# Tiles actually on screen decode ahead of the margin rows
+		vis_lo = int(view_y0 // row_height) * cols
+		vis_hi = (int((view_y0 + ch) // row_height) + 1) * cols
+		for i in [i for i in self._gallery_tiles if not lo <= i < hi]:
+			self._drop_tile(i)
+		# Superseded prefetches must not delay decodes for the tiles about to be created
+		self._cancel_thumb_prefetch()
+		# Columns share the width equally; tiles are centered in their column
+		col_w = cw / cols
+		relayout = (cw, cols, self.thumb_size) != self._gallery_layout
+		self._gallery_layout = (cw, cols, self.thumb_size)
+		for i in range(lo, hi):
+			x = int((i % cols + 0.5) * col_w)
+			y = (i // cols) * row_height + gap
+			if i not in self._gallery_tiles:
+				prio = PRIO_THUMB if vis_lo <= i < vis_hi else PRIO_THUMB_AHEAD
+				tile = self._create_tile(self.gallery_canvas, i, self.images[i], prio)
+				self._gallery_tiles[i] = tile
+				self._gallery_tile_items[i] = self.gallery_canvas.create_window(
+					x, y, window=tile, anchor="n", tags=("tile",)
+				)
+			elif relayout:
+				self.gallery_canvas.coords(self._gallery_tile_items[i], x, y)
+		# Let the prefetched PIL thumbnails hold about four screens worth
+		visible_rows = ch // row_height + 1
+		self._thumb_cache_max = max(64, 4 * cols * visible_rows)
+		self._update_selection_highlight()
+		self._gallery_view = (view_y0, n)
+		# Decode one screen ahead first (the usual scroll direction), then one behind
+		screen = cols * visible_rows
+		self._prefetch_thumbs(hi, hi + screen)
+		self._prefetch_thumbs(lo - screen, lo)
+
+	def _cols(self) -> int:
+		# Tile columns that fit the gallery canvas at the current thumbnail size
+		cw = max(1, self.gallery_canvas.winfo_width())
+		return max(1, (cw - self._gap) // (self._tile_w + self._gap))
 
 	def _update_selection_highlight(self) -> None:
-		if not self._gallery_tiles:
+		# Only the old and new selection change color; leave every other tile alone
+		if self._highlighted == self.index:
 			return
-		for i, tile in enumerate(self._gallery_tiles):
-			if tile is None:
-				continue
-			bg = self.colors["fg"] if i == self.index else self.colors["border"]
-			tile.configure(bg=bg)
+		old = self._gallery_tiles.get(self._highlighted) if self._highlighted is not None else None
+		if old is not None:
+			old.configure(bg=self.colors["border"])
+		new = self._gallery_tiles.get(self.index)
+		if new is not None:
+			new.configure(bg=self.colors["fg"])
+		self._highlighted = self.index
 
 	def _ensure_selected_visible(self) -> None:
-		if not self.gallery_canvas or not self._gallery_tiles or not (0 <= self.index < len(self._gallery_tiles)):
-			return
-		# Ensure tile exists around selection
-		self._ensure_loaded_upto(self.index)
-		# Compute target row and approximate y position and scroll to it
-		cw = max(1, self.gallery_canvas.winfo_width())
-		gap = 16
-		tile_w = self.thumb_size + 2 + 2
-		cols = max(1, (cw - gap) // (tile_w + gap))
-		row = self.index // cols
-		row_height = self.thumb_size + gap + 4
-		y = row * row_height
-		bbox = self.gallery_canvas.bbox("all")
-		if bbox:
-			max_y = max(1, bbox[3])
-			self.gallery_canvas.yview_moveto(max(0.0, min(1.0, y / max_y)))
-
-		# Trigger more loading if near bottom
-		self._maybe_trigger_load_more()
-
-	def _maybe_trigger_load_more(self) -> None:
-		if not self.gallery_canvas or not self._gallery_tiles:
-			return
-		bbox = self.gallery_canvas.bbox("all")
-		if not bbox:
-			return
-		_, y0, _, y1 = bbox
-		view_y0 = self.gallery_canvas.canvasy(0)
-		view_y1 = view_y0 + self.gallery_canvas.winfo_height()
-		# If within 1.5 screens of bottom, load more
-		if view_y1 + (self.gallery_canvas.winfo_height() * 0.5) >= y1:
-			self._load_next_batch()
-
-	def _load_next_batch(self) -> None:
-		if self._gallery_loading:
-			return
-		if self._gallery_loaded_count >= len(self._gallery_tiles):
+		if self.mode != "gallery" or self._gallery_region is None or not (0 <= self.index < len(self.images)):
 			return
-		self._gallery_loading = True
-		batch_size = 5
-		start = self._gallery_loaded_count
-		end = min(len(self._gallery_tiles), start + batch_size)
-		for i in range(start, end):
-			path = self.images[i]
-			tile = self._create_tile(self.gallery_frame, i, path)
-			self._gallery_tiles[i] = tile
-		self._gallery_loaded_count = end
-		self._layout_gallery()
-		self._update_selection_highlight()
-		self._gallery_loading = False
-		# If still near bottom, schedule another batch with slight delay to stay responsive
-		if self._gallery_load_after:
-			try:
-				self.after_cancel(self._gallery_load_after)
-			except Exception:
-				pass
-		self._gallery_load_after = self.after(50, self._maybe_trigger_load_more)
-		# Compute target row and approximate y position
-		cw = max(1, self.gallery_canvas.winfo_width())
-		gap = 16
-		tile_w = self.thumb_size + 2 + 2
-		cols = max(1, (cw - gap) // (tile_w + gap))
-		row = self.index // cols
-		row_height = self.thumb_size + gap + 4
-		y = row * row_height
-		bbox = self.gallery_canvas.bbox("all")
-		if bbox is None:
-			return
-		max_y = max(1, bbox[3])
+		# Scroll so the selected row is at the top; the yscroll hook materializes its tiles
+		y = (self.index // self._cols()) * (self._tile_w + self._gap)
+		max_y = max(1, self._gallery_region[3])
 		self.gallery_canvas.yview_moveto(max(0.0, min(1.0, y / max_y)))
 
 	# ----- Thumbnail size handling -----
@@ -965,6 +2051,7 @@ class PicCullApp(tk.Tk):
 			self.thumb_label.configure(text=f"Thumb {v}px")
 			return
 		self.thumb_size = v
+		self._tile_w = v + 4
 		self.thumb_size_var.set(v)
 		self.thumb_label.configure(text=f"Thumb {v}px")
 		# Rebuild gallery lazily at new size; keep cache for other sizes for future reuse
@@ -973,10 +2060,17 @@ class PicCullApp(tk.Tk):
 
 	def _on_close(self) -> None:
 		# Clear session caches (in-memory only) and exit
-		try:
-			self.thumb_cache.clear()
-		except Exception:
-			pass
+		self.thumb_cache.clear()
+		self._thumb_cache_bytes = 0
+		self._thumb_keys_by_path.clear()
+		# A folder scan on the I/O worker checks the generation per entry and stops;
+		# the worker thread is not a daemon, so a long scan would keep the process alive
+		with self._scan_lock:
+			self._scan_gen += 1
+		# Stop background decoding; a decode already running finishes on its own
+		self._decode_q.shutdown()
+		# Let an in-flight file move complete; nothing new is queued after close
+		self._io_exec.shutdown(wait=False)
 		# Remove any private fonts we added on Windows
 		if sys.platform.startswith("win") and self._win_private_fonts:
 			try:
@@ -993,11 +2087,7 @@ class PicCullApp(tk.Tk):
 	def _move_selection_up(self) -> None:
 		if self.mode != "gallery" or not self.images:
 			return
-		cw = max(1, self.gallery_canvas.winfo_width()) if self.gallery_canvas else 1
-		gap = 16
-		tile_w = self.thumb_size + 2 + 2
-		cols = max(1, (cw - gap) // (tile_w + gap))
-		self.index = max(0, self.index - cols)
+		self.index = max(0, self.index - self._cols())
 		self._set_status()
 		self._update_selection_highlight()
 		self._ensure_selected_visible()
@@ -1006,11 +2096,7 @@ class PicCullApp(tk.Tk):
 	def _move_selection_down(self) -> None:
 		if self.mode != "gallery" or not self.images:
 			return
-		cw = max(1, self.gallery_canvas.winfo_width()) if self.gallery_canvas else 1
-		gap = 16
-		tile_w = self.thumb_size + 2 + 2
-		cols = max(1, (cw - gap) // (tile_w + gap))
-		self.index = min(len(self.images) - 1, self.index + cols)
+		self.index = min(len(self.images) - 1, self.index + self._cols())
 		self._set_status()
 		self._update_selection_highlight()
 		self._ensure_selected_visible()
@@ -1018,7 +2104,10 @@ class PicCullApp(tk.Tk):
 
 
 def main() -> None:
-	app = PicCullApp()
+	use_system_trash = "--trash" in sys.argv[1:]
+	if use_system_trash and send2trash is None:
+		raise SystemExit("--trash needs send2trash. Install with: python -m pip install send2trash")
+	app = PicCullApp(use_system_trash=use_system_trash)
 	app.mainloop()
 
 